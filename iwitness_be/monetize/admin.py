@@ -5,4 +5,9 @@ from .models import Banks, UserBankAccount, UserEarning
 # Register your models here.
 admin.site.register(Banks)
 admin.site.register(UserBankAccount)
-admin.site.register(UserEarning)
+
+
+@admin.register(UserEarning)
+class UserEarningAdmin(admin.ModelAdmin):
+    list_display = ["user", "balance_display"]
+    list_select_related = ["user"]
@@ -2,11 +2,34 @@ from __future__ import annotations
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
+from rapidfuzz import fuzz
+from rapidfuzz.utils import default_process
+from requests.adapters import HTTPAdapter
 from rest_framework import serializers
-from thefuzz import fuzz
+from urllib3.util.retry import Retry
 
 from ..models import Banks, UserBankAccount, UserEarning
 
+_PAYSTACK_RESOLVE_URL = "https://api.paystack.co/bank/resolve"
+
+# Shared session so Paystack lookups reuse pooled keep-alive connections
+# instead of paying a fresh TCP + TLS handshake on every validation.
+# Retries are bounded and the final 5xx is returned rather than raised.
+_PAYSTACK_RETRY = Retry(
+    total=2, connect=2, read=1, backoff_factor=0.2, status_forcelist=(502, 503, 504), raise_on_status=False
+)
+_PAYSTACK_SESSION = requests.Session()
+_PAYSTACK_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_PAYSTACK_RETRY))
+_PAYSTACK_SESSION.headers.update(
+    {"Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}", "Accept": "application/json"}
+)
+
+
+def _normalize_name(name: str) -> str:
+    """Lowercase an account name and collapse its whitespace for a cheap equality check."""
+    return " ".join(name.lower().split())
+
 
 class BanksSerializer(serializers.ModelSerializer):
     class Meta:
@@ -22,10 +45,11 @@ class BanksSerializer(serializers.ModelSerializer):
 class UserBankAccountSerializer(serializers.ModelSerializer):
     # Include the BankSerializer for nested representation of 'bank' field
     bank = BanksSerializer(many=False, read_only=True)
+    user = serializers.CharField(source="user.username", read_only=True)
 
     class Meta:
         model = UserBankAccount
-        fields = ["id", "verified", "bank", "account_name", "account_number"]
+        fields = ["id", "verified", "bank", "account_name", "account_number", "user"]
 
     def validate_account_number(self, value):
         """
@@ -40,38 +64,60 @@ class UserBankAccountSerializer(serializers.ModelSerializer):
         Raises:
         - serializers.ValidationError: If validation fails.
         """
-        # Replace 'your_paystack_secret_key' with your actual Paystack secret key
-        paystack_api_url = (
-            f"https://api.paystack.co/bank/resolve?account_number={value}&bank_code={self.initial_data['bank_code']}"
-        )
+        bank_code = self.initial_data["bank_code"]
+        cache_key = f"paystack:resolve:{bank_code}:{value}"
+
+        # Reuse a recent successful resolution of the same account instead of asking Paystack again
+        resolved = cache.get(cache_key)
+
+        if resolved is None:
+            # Make a GET request to Paystack API over the shared session, bounded so a stalled
+            # upstream cannot hold the worker
+            try:
+                response = _PAYSTACK_SESSION.get(
+                    _PAYSTACK_RESOLVE_URL,
+                    params={"account_number": value, "bank_code": bank_code},
+                    timeout=(3.05, 5),
+                )
+            except requests.RequestException:
+                raise serializers.ValidationError("Error connecting to Paystack API.")
 
-        # Make a GET request to Paystack API
-        response = requests.get(paystack_api_url, headers={"Authorization": f"Bearer {settings.PAYSTACK_SECRET_KEY}"})
+            # Check if the response is successful
+            if response.status_code != 200:
+                raise serializers.ValidationError("Error connecting to Paystack API.")
 
-        # Check if the response is successful
-        if response.status_code == 200:
             response_data = response.json()
 
             # Check if the account number is resolved
-            if response_data.get("status") and response_data.get("message") == "Account number resolved":
-                # Compare the names for similarity (use your similarity function)
-                similarity_score = fuzz.token_sort_ratio(
-                    response_data["data"]["account_name"], self.initial_data["account_name"]
-                )
+            if not (response_data.get("status") and response_data.get("message") == "Account number resolved"):
+                raise serializers.ValidationError("Paystack account verification failed.")
 
-                # Define a threshold for similarity (e.g., 70%)
-                similarity_threshold = 80
+            # Only successful resolutions are cached, failures are always retried
+            resolved = {"account_name": response_data["data"]["account_name"]}
+            cache.set(cache_key, resolved, timeout=300)
 
-                if similarity_score >= similarity_threshold:
-                    # If similar, update the account name with the resolved name
-                    self.initial_data["account_name"] = response_data["data"]["account_name"]
-                    return value
-                else:
-                    raise serializers.ValidationError("Account name does not match with Paystack verification.")
-            else:
-                raise serializers.ValidationError("Paystack account verification failed.")
+        # Most users type the resolved name as-is, so skip the fuzzy scoring when it matches exactly
+        if _normalize_name(resolved["account_name"]) == _normalize_name(self.initial_data["account_name"]):
+            self.initial_data["account_name"] = resolved["account_name"]
+            return value
+
+        # Define a threshold for similarity (e.g., 70%)
+        similarity_threshold = 80
+
+        # Compare the names for similarity, scores below the cutoff come back as 0
+        similarity_score = fuzz.token_sort_ratio(
+            resolved["account_name"],
+            self.initial_data["account_name"],
+            processor=default_process,
+            score_cutoff=similarity_threshold,
+        )
+
+        if similarity_score >= similarity_threshold:
+            # If similar, update the account name with the resolved name
+            self.initial_data["account_name"] = resolved["account_name"]
+            return value
         else:
-            raise serializers.ValidationError("Error connecting to Paystack API.")
+            raise serializers.ValidationError("Account name does not match with Paystack verification.")
 
     def update(self, instance, validated_data):
         """
@@ -88,41 +134,13 @@ class UserBankAccountSerializer(serializers.ModelSerializer):
         validated_data.pop("user", None)
         return super().update(instance, **validated_data)
 
-    def to_representation(self, instance):
-        """
-        Custom method to include the 'user' field in the serialized representation.
-
-        Args:
-        - instance: The UserBankAccount instance being serialized.
-
-        Returns:
-        - dict: The serialized representation of the UserBankAccount instance.
-        """
-        ret = super().to_representation(instance)
-        ret["user"] = instance.user.username
-        return ret
-
 
 class UserEarningSerializer(serializers.ModelSerializer):
+    # Balances are stored in kobo but served in naira, e.g. "1250.05", as they always have been
+    balance = serializers.CharField(source="balance_display", read_only=True)
+    user = serializers.CharField(source="user.username", read_only=True)
+
     class Meta:
         # Define the model and fields to include in the serializer
         model = UserEarning
-        fields = ["id", "balance"]
-
-    def to_representation(self, instance):
-        """
-        Custom method to include the 'user' field in the serialized representation.
-
-        Args:
-        - instance: The UserEarning instance being serialized.
-
-        Returns:
-        - dict: The serialized representation of the UserEarning instance.
-        """
-        # Use the default representation and add the 'user' field
-        ret = super().to_representation(instance)
-
-        # Add the 'user' field, representing the username of the user associated with the UserEarning
-        ret["user"] = instance.user.username
-
-        return ret
+        fields = ["id", "balance", "user"]
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import hashlib
+
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models import Count, Max, prefetch_related_objects
 from django.db.models.query import QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
 from rest_framework.mixins import ListModelMixin, RetrieveModelMixin, UpdateModelMixin
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAuthenticatedOrReadOnly
 from rest_framework.response import Response
@@ -12,6 +19,7 @@ from rest_framework.viewsets import GenericViewSet
 from config.pagination import CustomPagination
 from iwitness_be.monetize.models import Banks, UserBankAccount, UserEarning
 from iwitness_be.utils.permissions import IsOwnerOrStaff
+from iwitness_be.utils.renderers import ORJSONRenderer
 
 from .serializers import BanksSerializer, UserBankAccountSerializer, UserEarningSerializer
 
@@ -19,11 +27,46 @@ User = get_user_model()
 
 
 class BankViewSet(RetrieveModelMixin, ListModelMixin, GenericViewSet):
-    queryset = Banks.objects.all()
+    queryset = Banks.objects.only("id", "name", "lcode", "code", "country_iso")
     serializer_class = BanksSerializer
     lookup_field = "pk"
     permission_classes = [AllowAny]
     pagination_class = CustomPagination
+    renderer_classes = [ORJSONRenderer]
+
+    def list(self, request, *args, **kwargs):
+        """
+        Custom list method that serves the banks from cache and honours conditional requests.
+
+        Banks only changes when the Paystack list is synced, so the serialized list is cached against
+        the latest `modified` timestamp and row count, and clients holding a matching ETag get a 304.
+        The cached list is paginated per request, so the pagination links always follow its host.
+
+        Args:
+        - request: The DRF request object.
+
+        Returns:
+        - Response: The DRF response object with the paginated banks, or a 304 Not Modified response.
+        """
+        # The row count is folded in so deleted banks also change the version. No Last-Modified is sent,
+        # `Max("modified")` alone does not move when a bank is deleted.
+        state = Banks.objects.aggregate(last_modified=Max("modified"), total=Count("pk"))
+        last_modified = state["last_modified"]
+        version = f"{last_modified.timestamp() if last_modified else 0}:{state['total']}"
+        etag = quote_etag(hashlib.md5(version.encode(), usedforsecurity=False).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            cache_key = f"banks:list:{version}"
+            banks = cache.get(cache_key)
+            if banks is None:
+                banks = list(self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data)
+                cache.set(cache_key, banks, 3600)
+
+            response = self.get_paginated_response(self.paginate_queryset(banks))
+
+        response["ETag"] = etag
+        return response
 
 
 class BankAccountViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, GenericViewSet):
@@ -31,7 +74,17 @@ class BankAccountViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, G
     Viewset for performing CRUD operations on user bank accounts.
     """
 
-    queryset = UserBankAccount.objects.all()
+    queryset = UserBankAccount.objects.select_related("user", "bank").only(
+        "id",
+        "verified",
+        "account_name",
+        "account_number",
+        "user__username",
+        "bank__name",
+        "bank__lcode",
+        "bank__code",
+        "bank__country_iso",
+    )
     serializer_class = UserBankAccountSerializer
     lookup_field = "pk"
     permission_classes = [IsOwnerOrStaff, IsAuthenticatedOrReadOnly]
@@ -47,31 +100,23 @@ class BankAccountViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, G
         if user.is_staff:
             return queryset  # Staff can view all bank accounts
 
-        return queryset.filter(user=user)
+        return queryset.filter(user_id=user.pk)
 
     @action(detail=False)
     def details(self, request):
-        try:
-            # Use the queryset directly to get the user's bank account instance
-            bank_account_instance = UserBankAccount.objects.get(user=request.user)
+        # Fetch the user's bank account with its bank joined, a missing account is returned as a 404
+        bank_account_instance = get_object_or_404(
+            UserBankAccount.objects.select_related("bank", "user"), user=request.user
+        )
 
-            # Serialize the user's bank account instance
-            serializer = UserBankAccountSerializer(bank_account_instance, context={"request": request})
+        # Serialize the user's bank account instance
+        serializer = UserBankAccountSerializer(bank_account_instance, context={"request": request})
 
-            # Return a success response with the serialized data and a message
-            return Response(
-                status=status.HTTP_200_OK,
-                data={"message": "User bank account details fetched successfully", "data": serializer.data},
-            )
-        except UserBankAccount.DoesNotExist:
-            # Return a not found response if the user's bank account instance does not exist
-            return Response(status=status.HTTP_404_NOT_FOUND, data={"message": "User bank account details not found"})
-        except Exception as e:
-            # Return a bad request response with an error message
-            return Response(
-                status=status.HTTP_400_BAD_REQUEST,
-                data={"message": f"There was an error fetching the user bank account details. {str(e)}"},
-            )
+        # Return a success response with the serialized data and a message
+        return Response(
+            status=status.HTTP_200_OK,
+            data={"message": "User bank account details fetched successfully", "data": serializer.data},
+        )
 
     def update(self, request, *args, **kwargs):
         """
@@ -114,7 +159,9 @@ class BankAccountViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, G
         - Response: The DRF response object with the list of user bank accounts.
         """
         try:
-            user_bank_accounts = self.get_queryset()
+            user_bank_accounts = list(self.get_queryset())
+            # No-op when select_related already joined the bank, guards against it being dropped
+            prefetch_related_objects(user_bank_accounts, "bank")
             serialized_bank_accounts = self.get_serializer(user_bank_accounts, many=True).data
 
             return Response(
@@ -133,15 +180,14 @@ class BankAccountViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, G
 
 
 class EarningViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, GenericViewSet):
-    queryset = UserEarning.objects.all()
+    queryset = UserEarning.objects.select_related("user").all()
     serializer_class = UserEarningSerializer
     lookup_field = "pk"
     permission_classes = [IsAuthenticated]
     pagination_class = CustomPagination
 
     def get_queryset(self, *args, **kwargs):
-        assert isinstance(self.request.user.id, int)
-        return self.queryset.filter(user=self.request.user)
+        return self.queryset.filter(user_id=self.request.user.pk)
 
     def update(self, request, *args, **kwargs):
         """
@@ -185,26 +231,14 @@ class EarningViewSet(RetrieveModelMixin, UpdateModelMixin, ListModelMixin, Gener
         Returns:
         - Response: The DRF response object with the serialized earnings balance and a success message.
         """
-        try:
-            # Use the queryset directly to get the user's earnings instance
-            user_earning_instance = UserEarning.objects.get(user=request.user)
+        # Fetch the user's earnings instance, a missing one is returned as a 404
+        user_earning_instance = get_object_or_404(UserEarning.objects.select_related("user"), user=request.user)
 
-            # Serialize the user's earnings instance
-            serializer = UserEarningSerializer(user_earning_instance, context={"request": request})
+        # Serialize the user's earnings instance
+        serializer = UserEarningSerializer(user_earning_instance, context={"request": request})
 
-            # Return a success response with the serialized data and a message
-            return Response(
-                status=status.HTTP_200_OK,
-                data={"message": "User balance fetched successfully", "data": serializer.data},
-            )
-
-        except UserEarning.DoesNotExist:
-            # Return a not found response if the user's earnings instance does not exist
-            return Response(status=status.HTTP_404_NOT_FOUND, data={"message": "User balance not found"})
-
-        except Exception as e:
-            # Return a bad request response with an error message
-            return Response(
-                status=status.HTTP_400_BAD_REQUEST,
-                data={"message": f"There was an error fetching the user balance. {str(e)}"},
-            )
+        # Return a success response with the serialized data and a message
+        return Response(
+            status=status.HTTP_200_OK,
+            data={"message": "User balance fetched successfully", "data": serializer.data},
+        )
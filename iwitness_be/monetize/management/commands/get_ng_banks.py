@@ -5,6 +5,7 @@ import pprint
 import requests
 from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import IntegrityError, transaction
 from django.utils.translation import gettext_lazy as _
 
 # from requests_html import HTMLSession
@@ -33,18 +34,21 @@ class Command(BaseCommand):
         LOGGER.info(pp.pprint(res))
 
         if res["status"]:
-            for response in res["data"]:
-                try:
-                    Banks.objects.create(
-                        name=response["name"],
-                        slug=response["slug"],
-                        lcode=response["longcode"],
-                        code=response["code"],
-                        country_iso="NG",
-                    )
-                    LOGGER.info(f"Successfully added {response['name']}")
-                except Exception as e:
-                    LOGGER.error(e)
+            try:
+                # Each attempt runs in its own atomic block so a failed upsert is rolled back on its own
+                with transaction.atomic():
+                    banks = Banks.sync_from_paystack(res["data"], country_iso="NG")
+                LOGGER.info(f"Successfully added or updated {len(banks)} banks")
+            except IntegrityError as e:
+                # A conflicting row aborts the whole batch, retry bank by bank so only the bad rows are skipped
+                LOGGER.error(e)
+                for bank in res["data"]:
+                    try:
+                        with transaction.atomic():
+                            Banks.sync_from_paystack([bank], country_iso="NG")
+                        LOGGER.info(f"Successfully added or updated {bank['name']}")
+                    except IntegrityError as e:
+                        LOGGER.error(e)
         else:
             LOGGER.error("Nigerian Banks Not Updated")
 
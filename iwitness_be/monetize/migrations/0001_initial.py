@@ -0,0 +1,134 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:33
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import model_utils.fields
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Banks",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                ("name", models.CharField(max_length=500, unique=True)),
+                ("slug", models.SlugField(unique=True)),
+                ("lcode", models.CharField(db_index=True, max_length=25)),
+                ("code", models.CharField(db_index=True, max_length=10)),
+                ("country_iso", models.CharField(max_length=10)),
+            ],
+            options={
+                "verbose_name": "Bank",
+                "verbose_name_plural": "Banks",
+                "ordering": ["name"],
+            },
+        ),
+        migrations.CreateModel(
+            name="UserEarning",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "balance",
+                    models.DecimalField(
+                        decimal_places=2, default=0, help_text="Current balance of the user's earnings.", max_digits=20
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_earning",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Earning",
+                "verbose_name_plural": "Users Earning",
+                "ordering": ["-modified"],
+            },
+        ),
+        migrations.CreateModel(
+            name="UserBankAccount",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    model_utils.fields.AutoCreatedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="created"
+                    ),
+                ),
+                (
+                    "modified",
+                    model_utils.fields.AutoLastModifiedField(
+                        default=django.utils.timezone.now, editable=False, verbose_name="modified"
+                    ),
+                ),
+                (
+                    "verified",
+                    models.BooleanField(default=False, help_text="Indicates whether the bank account is verified."),
+                ),
+                (
+                    "account_name",
+                    models.CharField(blank=True, help_text="Name associated with the bank account.", max_length=255),
+                ),
+                (
+                    "account_number",
+                    models.CharField(
+                        blank=True, db_index=True, help_text="Bank account number.", max_length=16, unique=True
+                    ),
+                ),
+                (
+                    "bank",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE, related_name="bank_name", to="monetize.banks"
+                    ),
+                ),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="user_bank",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "User Bank Account",
+                "verbose_name_plural": "Users Bank Account",
+                "ordering": ["-created"],
+            },
+        ),
+    ]
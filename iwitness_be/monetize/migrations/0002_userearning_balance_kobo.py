@@ -0,0 +1,30 @@
+from decimal import Decimal
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def naira_to_kobo(apps, schema_editor):
+    UserEarning = apps.get_model("monetize", "UserEarning")
+    UserEarning.objects.update(balance=F("balance") * 100)
+
+
+def kobo_to_naira(apps, schema_editor):
+    UserEarning = apps.get_model("monetize", "UserEarning")
+    UserEarning.objects.update(balance=F("balance") / Decimal(100))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("monetize", "0001_initial"),
+    ]
+
+    operations = [
+        # Scale while the column is still a decimal, the cast to bigint then keeps every kobo
+        migrations.RunPython(naira_to_kobo, kobo_to_naira),
+        migrations.AlterField(
+            model_name="userearning",
+            name="balance",
+            field=models.BigIntegerField(default=0, help_text="Current balance of the user's earnings in kobo."),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("monetize", "0002_userearning_balance_kobo"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="userbankaccount",
+            name="account_number",
+            field=models.CharField(blank=True, help_text="Bank account number.", max_length=16, unique=True),
+        ),
+    ]
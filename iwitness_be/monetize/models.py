@@ -1,5 +1,14 @@
 from django.contrib.auth import get_user_model
-from django.db.models import CASCADE, BooleanField, CharField, DecimalField, ForeignKey, OneToOneField, SlugField
+from django.db.models import (
+    CASCADE,
+    BigIntegerField,
+    BooleanField,
+    CharField,
+    ForeignKey,
+    OneToOneField,
+    SlugField,
+)
+from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 from model_utils.models import TimeStampedModel
 
@@ -23,6 +32,52 @@ class Banks(TimeStampedModel):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        # Slugify once when the bank is first stored without one, lookups then go through the unique slug index
+        if not self.slug:
+            self.slug = slugify(self.name)
+        super().save(*args, **kwargs)
+
+    @classmethod
+    def sync_from_paystack(cls, payload, country_iso="NG"):
+        """
+        Insert or update banks from a Paystack `/bank` payload in batched upserts.
+
+        Rows repeating a slug or name already seen in the payload are skipped, a single upsert
+        cannot touch the same row twice.
+
+        Args:
+        - payload (list): Bank dicts as returned in the `data` key of the Paystack response.
+        - country_iso (str): ISO code stored on every bank in the payload.
+
+        Returns:
+        - list: The Banks instances sent to the database.
+
+        Raises:
+        - IntegrityError: If a bank's name is already stored under another slug.
+        """
+        banks = {}
+        names = set()
+        for bank in payload:
+            slug = bank.get("slug") or slugify(bank["name"])
+            if slug in banks or bank["name"] in names:
+                continue
+            names.add(bank["name"])
+            banks[slug] = cls(
+                name=bank["name"],
+                slug=slug,
+                lcode=bank["longcode"],
+                code=bank["code"],
+                country_iso=country_iso,
+            )
+        return cls.objects.bulk_create(
+            list(banks.values()),
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=["name", "lcode", "code", "country_iso", "modified"],
+        )
+
     class Meta:
         verbose_name = _("Bank")
         verbose_name_plural = _("Banks")
@@ -34,13 +89,11 @@ class UserBankAccount(TimeStampedModel):
     Model to store bank account information for users.
     """
 
-    user = OneToOneField(User, on_delete=CASCADE, related_name="user_bank", db_index=True)
+    user = OneToOneField(User, on_delete=CASCADE, related_name="user_bank")
     verified = BooleanField(default=False, help_text=_("Indicates whether the bank account is verified."))
     bank = ForeignKey(Banks, on_delete=CASCADE, related_name="bank_name")
     account_name = CharField(max_length=255, blank=True, help_text=_("Name associated with the bank account."))
-    account_number = CharField(
-        max_length=16, blank=True, unique=True, db_index=True, help_text=_("Bank account number.")
-    )
+    account_number = CharField(max_length=16, blank=True, unique=True, help_text=_("Bank account number."))
 
     def __str__(self):
         return f"Bank Account for {self.user.username}"
@@ -56,14 +109,26 @@ class UserEarning(TimeStampedModel):
     Model to store user earnings information.
     """
 
-    user = OneToOneField(User, on_delete=CASCADE, related_name="user_earning", db_index=True)
-    balance = DecimalField(
-        max_digits=20, decimal_places=2, default=0, help_text=_("Current balance of the user's earnings.")
-    )
+    user = OneToOneField(User, on_delete=CASCADE, related_name="user_earning")
+    balance = BigIntegerField(default=0, help_text=_("Current balance of the user's earnings in kobo."))
 
     def __str__(self):
         return f"Earnings for {self.user.username}"
 
+    @property
+    def balance_display(self):
+        """
+        Format the kobo balance as a naira amount with two decimal places.
+
+        Shared by the admin and the API so the conversion lives in one place.
+
+        Returns:
+        - str: The formatted balance, e.g. "1250.05".
+        """
+        naira, kobo = divmod(abs(self.balance), 100)
+        sign = "-" if self.balance < 0 else ""
+        return f"{sign}{naira}.{kobo:02d}"
+
     class Meta:
         verbose_name = _("User Earning")
         verbose_name_plural = _("Users Earning")
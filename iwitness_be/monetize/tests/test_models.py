@@ -0,0 +1,59 @@
+from io import StringIO
+
+import pytest
+import requests
+from django.core.management import call_command
+
+from iwitness_be.monetize.models import Banks
+
+pytestmark = pytest.mark.django_db
+
+
+def paystack_bank(name, slug, code, longcode=None):
+    return {"name": name, "slug": slug, "code": code, "longcode": longcode or f"{code}150000"}
+
+
+class TestBanksSyncFromPaystack:
+    def test_second_sync_updates_existing_banks(self):
+        Banks.sync_from_paystack(
+            [paystack_bank("Access Bank", "access-bank", "044"), paystack_bank("Zenith Bank", "zenith-bank", "057")]
+        )
+        Banks.sync_from_paystack(
+            [
+                paystack_bank("Access Bank Plc", "access-bank", "044", longcode="044150149"),
+                paystack_bank("Zenith Bank", "zenith-bank", "057"),
+                paystack_bank("Kuda Bank", "kuda-bank", "50211"),
+            ]
+        )
+
+        assert Banks.objects.count() == 3
+        access = Banks.objects.get(slug="access-bank")
+        assert access.name == "Access Bank Plc"
+        assert access.lcode == "044150149"
+        assert access.country_iso == "NG"
+
+    def test_duplicate_payload_rows_are_skipped(self):
+        Banks.sync_from_paystack(
+            [
+                paystack_bank("Access Bank", "access-bank", "044"),
+                paystack_bank("Access Bank (Diamond)", "access-bank", "063"),
+                paystack_bank("Access Bank", "access-bank-2", "044"),
+            ]
+        )
+
+        assert list(Banks.objects.values_list("slug", "code")) == [("access-bank", "044")]
+
+
+def test_get_ng_banks_skips_conflicting_rows(monkeypatch):
+    """A bank stored under another slug is skipped without aborting the rest of the sync."""
+    Banks.objects.create(name="Access Bank", slug="access-bank-old", lcode="044150149", code="044")
+    payload = [paystack_bank("Access Bank", "access-bank", "044"), paystack_bank("Kuda Bank", "kuda-bank", "50211")]
+
+    class PaystackResponse:
+        def json(self):
+            return {"status": True, "data": payload}
+
+    monkeypatch.setattr(requests, "request", lambda *args, **kwargs: PaystackResponse())
+    call_command("get_ng_banks", stdout=StringIO())
+
+    assert sorted(Banks.objects.values_list("slug", flat=True)) == ["access-bank-old", "kuda-bank"]
@@ -0,0 +1,89 @@
+import pytest
+import requests
+from django.core.cache import cache
+from rest_framework.exceptions import ValidationError
+
+from iwitness_be.monetize.api import serializers
+from iwitness_be.monetize.api.serializers import UserBankAccountSerializer
+
+ACCOUNT_NUMBER = "0123456789"
+
+
+class PaystackResponse:
+    def __init__(self, status_code=200, account_name="Ada Eze", message="Account number resolved"):
+        self.status_code = status_code
+        self.payload = {"status": status_code == 200, "message": message, "data": {"account_name": account_name}}
+
+    def json(self):
+        return self.payload
+
+
+class TestValidateAccountNumber:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        cache.clear()
+
+    @pytest.fixture
+    def paystack(self, monkeypatch):
+        """Stand-in for the shared Paystack session, recording every lookup."""
+
+        class Session:
+            response = PaystackResponse()
+            calls = []
+
+            def get(self, url, params=None, timeout=None):
+                self.calls.append(params)
+                if isinstance(self.response, Exception):
+                    raise self.response
+                return self.response
+
+        session = Session()
+        monkeypatch.setattr(serializers._PAYSTACK_SESSION, "get", session.get)
+        return session
+
+    def validate(self, account_name):
+        serializer = UserBankAccountSerializer(
+            data={"account_number": ACCOUNT_NUMBER, "bank_code": "044", "account_name": account_name}
+        )
+        return serializer, serializer.validate_account_number(ACCOUNT_NUMBER)
+
+    def test_cached_resolution_skips_paystack(self, paystack):
+        self.validate("Ada Eze")
+        self.validate("Ada Eze")
+
+        assert paystack.calls == [{"account_number": ACCOUNT_NUMBER, "bank_code": "044"}]
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            PaystackResponse(status_code=502),
+            PaystackResponse(message="Could not resolve account name"),
+            requests.ConnectionError("connection reset"),
+        ],
+    )
+    def test_failures_raise_and_are_not_cached(self, paystack, response):
+        paystack.response = response
+
+        with pytest.raises(ValidationError):
+            self.validate("Ada Eze")
+
+        paystack.response = PaystackResponse()
+        self.validate("Ada Eze")
+        assert len(paystack.calls) == 2
+
+    def test_normalized_equal_name_takes_the_resolved_spelling(self, paystack):
+        serializer, value = self.validate("  ada   EZE ")
+
+        assert value == ACCOUNT_NUMBER
+        assert serializer.initial_data["account_name"] == "Ada Eze"
+
+    def test_similarity_at_threshold_is_accepted(self, paystack):
+        # token_sort_ratio("ada eze", "ada ezxy") is exactly 80
+        serializer, _ = self.validate("Ada Ezxy")
+
+        assert serializer.initial_data["account_name"] == "Ada Eze"
+
+    def test_similarity_below_threshold_is_rejected(self, paystack):
+        # token_sort_ratio("ada eze", "ada ezxyz") is 75
+        with pytest.raises(ValidationError, match="Account name does not match"):
+            self.validate("Ada Ezxyz")
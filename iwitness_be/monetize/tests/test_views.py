@@ -0,0 +1,82 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from rest_framework.test import APIRequestFactory
+
+from iwitness_be.monetize.api.views import BankViewSet
+from iwitness_be.monetize.models import Banks
+
+pytestmark = pytest.mark.django_db
+
+
+class TestBankViewSetList:
+    @pytest.fixture(autouse=True)
+    def banks(self):
+        cache.clear()
+        return [
+            Banks.objects.create(name=f"Bank {index:02d}", lcode=f"L{index}", code=f"{index:03d}", country_iso="NG")
+            for index in range(15)
+        ]
+
+    @pytest.fixture
+    def api_rf(self) -> APIRequestFactory:
+        return APIRequestFactory()
+
+    def get(self, api_rf, path="/banks/", **extra):
+        response = BankViewSet.as_view({"get": "list"})(api_rf.get(path, **extra))
+        # A 304 is a plain HttpResponseNotModified with nothing to render
+        if hasattr(response, "render"):
+            response.render()
+        return response
+
+    def test_conditional_get_round_trip(self, api_rf: APIRequestFactory):
+        response = self.get(api_rf)
+        assert response.status_code == 200
+        assert response["ETag"]
+
+        response = self.get(api_rf, HTTP_IF_NONE_MATCH=response["ETag"])
+        assert response.status_code == 304
+        assert response["ETag"]
+
+    def test_changed_bank_invalidates_cached_page(self, api_rf: APIRequestFactory, banks):
+        etag = self.get(api_rf)["ETag"]
+
+        banks[0].name = "Access Bank"
+        banks[0].save()
+
+        response = self.get(api_rf, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response["ETag"] != etag
+        assert "Access Bank" in [bank["name"] for bank in json.loads(response.content)["results"]]
+
+    def test_deleted_bank_invalidates_cached_page(self, api_rf: APIRequestFactory, banks):
+        etag = self.get(api_rf)["ETag"]
+
+        banks[0].delete()
+
+        response = self.get(api_rf, HTTP_IF_NONE_MATCH=etag, HTTP_IF_MODIFIED_SINCE="Fri, 01 Jan 2100 00:00:00 GMT")
+        assert response.status_code == 200
+        assert json.loads(response.content)["count"] == 14
+
+    def test_pages_are_served_from_the_cached_list(self, api_rf: APIRequestFactory, django_assert_num_queries):
+        self.get(api_rf)
+
+        # Only the version aggregate runs once the list is cached
+        with django_assert_num_queries(1):
+            response = self.get(api_rf, "/banks/?page=02")
+
+        data = json.loads(response.content)
+        assert [bank["name"] for bank in data["results"]] == [f"Bank {index:02d}" for index in range(10, 15)]
+        assert data["previous"] == "http://testserver/banks/"
+
+    def test_links_are_built_for_each_request(self, api_rf: APIRequestFactory, settings):
+        settings.ALLOWED_HOSTS = ["first.example.com", "second.example.com"]
+        self.get(api_rf, HTTP_HOST="first.example.com")
+        response = self.get(api_rf, HTTP_HOST="second.example.com")
+
+        data = json.loads(response.content)
+        assert data["count"] == 15
+        assert len(data["results"]) == 10
+        assert data["next"] == "http://second.example.com/banks/?page=2"
+        assert data["previous"] is None
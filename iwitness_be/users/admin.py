@@ -19,7 +19,14 @@ if settings.DJANGO_ADMIN_FORCE_ALLAUTH:
 admin.site.register(Profile)
 admin.site.register(UserFollow)
 admin.site.register(UserLocation)
-admin.site.register(UserPrivacyConsent)
+
+
+@admin.register(UserPrivacyConsent)
+class UserPrivacyConsentAdmin(admin.ModelAdmin):
+    list_select_related = ["user"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).lean()
 
 
 @admin.register(User)
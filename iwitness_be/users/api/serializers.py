@@ -9,7 +9,9 @@ User = get_user_model()
 class UserSerializer(serializers.ModelSerializer[UserType]):
     class Meta:
         model = User
-        fields = ["name", "url"]
+        fields = ["name", "url", "followers_count", "following_count"]
+        # Maintained by the UserFollow signals, never written through the API
+        read_only_fields = ["followers_count", "following_count"]
 
         extra_kwargs = {
             "url": {"view_name": "api:user-detail", "lookup_field": "pk"},
@@ -1,5 +1,6 @@
 from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import UserManager as DjangoUserManager
+from django.db.models import QuerySet
 
 
 class UserManager(DjangoUserManager):
@@ -32,3 +33,13 @@ class UserManager(DjangoUserManager):
             raise ValueError("Superuser must have is_superuser=True.")
 
         return self._create_user(email, password, **extra_fields)
+
+
+class UserPrivacyConsentQuerySet(QuerySet):
+    """Custom queryset for the UserPrivacyConsent model."""
+
+    def lean(self):
+        """
+        Consents without the `user_agent` column, which holds long browser strings rarely needed in lists.
+        """
+        return self.defer("user_agent")
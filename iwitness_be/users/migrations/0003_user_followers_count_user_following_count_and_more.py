@@ -0,0 +1,54 @@
+# Generated by Django 4.2.7 on 2026-10-15 22:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0002_alter_user_options_user_first_name_user_last_name_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="followers_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="user",
+            name="following_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name="profile",
+            index=models.Index(fields=["-created"], name="profile_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["-date_joined"], name="user_date_joined_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(condition=models.Q(("verified", True)), fields=["verified"], name="user_verified_true"),
+        ),
+        migrations.AddIndex(
+            model_name="userfollow",
+            index=models.Index(fields=["-created"], name="userfollow_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="userlocation",
+            index=models.Index(fields=["-created"], name="userlocation_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="userprivacyconsent",
+            index=models.Index(fields=["-created"], name="privacyconsent_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="userprivacyconsent",
+            index=models.Index(
+                condition=models.Q(("of_legal_age", False)),
+                fields=["of_legal_age"],
+                name="privacyconsent_underage_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+from django.db import migrations
+from django.db.models import Exists, OuterRef
+
+
+def backfill_verified(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    EmailAddress = apps.get_model("account", "EmailAddress")
+    verified_primary = EmailAddress.objects.filter(user_id=OuterRef("pk"), primary=True, verified=True)
+    # Superusers keep the flag they were created with
+    User.objects.filter(is_superuser=False).update(verified=Exists(verified_primary))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("account", "0005_emailaddress_idx_upper_email"),
+        ("users", "0003_user_followers_count_user_following_count_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_verified, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_follow_counts(apps, schema_editor):
+    User = apps.get_model("users", "User")
+    UserFollow = apps.get_model("users", "UserFollow")
+
+    def count_of(field):
+        follows = UserFollow.objects.filter(**{field: OuterRef("pk")}).order_by().values(field)
+        return Coalesce(Subquery(follows.annotate(total=Count("pk")).values("total")), 0)
+
+    User.objects.update(followers_count=count_of("following"), following_count=count_of("follower"))
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0004_backfill_user_verified"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_follow_counts, migrations.RunPython.noop),
+    ]
@@ -11,16 +11,20 @@ from django.db.models import (
     FileField,
     ForeignKey,
     GenericIPAddressField,
+    Index,
     ManyToManyField,
     OneToOneField,
+    PositiveIntegerField,
+    Q,
     TextField,
 )
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 from model_utils import FieldTracker
 from model_utils.models import TimeStampedModel
 
-from iwitness_be.users.managers import UserManager
+from iwitness_be.users.managers import UserManager, UserPrivacyConsentQuerySet
 from iwitness_be.utils.validators import validate_uploaded_image_extension
 
 
@@ -34,16 +38,19 @@ class User(AbstractUser):
     Attributes:
     - name (str): The name of the user (optional).
     - email (str): The unique email address of the user.
-    - verified (bool): Indicates whether the user's email is verified.
+    - verified (bool): Indicates whether the user's primary email is verified (always set for new superusers).
     - user_ip (str): The IP address of the user (optional).
     - followers (ManyToManyField): Relationship with other users who are followers.
-    - tracker (FieldTracker): Tracks changes in specified fields.
+    - followers_count (int): Number of users following this user, kept in sync by signals.
+    - following_count (int): Number of users this user follows, kept in sync by signals.
+    - _orig_user_ip (str): The `user_ip` value as loaded from the database.
 
     Properties:
     - is_email_verified (bool): Checks if the user's email is verified.
-    - user_token (str): Retrieves the authentication token for the user.
+    - user_token (str): Retrieves the authentication token for the user (cached per instance).
 
     Methods:
+    - from_db(): Snapshots the loaded `user_ip` into `_orig_user_ip`.
     - get_absolute_url(): Generates the URL for the user's detail view.
 
     Meta:
@@ -57,29 +64,55 @@ class User(AbstractUser):
     email = EmailField(_("email address"), unique=True)
     verified = BooleanField(default=False)
     user_ip = GenericIPAddressField(null=True, blank=True)
-    followers = ManyToManyField("self", symmetrical=False, through="UserFollow", related_name="following")
-    tracker = FieldTracker(fields=["user_ip"])
+    # `following` is the followed user and `follower` the one following, the follow counters rely on this order
+    followers = ManyToManyField(
+        "self",
+        symmetrical=False,
+        through="UserFollow",
+        through_fields=("following", "follower"),
+        related_name="following",
+    )
+    followers_count = PositiveIntegerField(default=0)
+    following_count = PositiveIntegerField(default=0)
 
     USERNAME_FIELD = "email"
     REQUIRED_FIELDS = []
 
     objects = UserManager()
 
+    # Only user_ip needs its previous value, a snapshot taken on load is cheaper than a FieldTracker
+    _orig_user_ip = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """
+        Load an instance from the database, remembering the `user_ip` it was loaded with.
+
+        Returns:
+        - User: The loaded instance.
+        """
+        instance = super().from_db(db, field_names, values)
+        if "user_ip" in field_names:
+            instance._orig_user_ip = values[field_names.index("user_ip")]
+        return instance
+
     @property
     def is_email_verified(self):
         """
         Check if the user's email is verified.
 
+        Reads the `verified` column, which mirrors the primary email address whenever an EmailAddress is
+        saved. Addresses verified without a save (e.g. the allauth admin's bulk "mark verified" action)
+        are still found by querying EmailAddress for users not flagged yet.
+
         Returns:
         - bool: True if the email is verified, False otherwise.
         """
-        try:
-            email_address = EmailAddress.objects.get_for_user(self, self.email)
-            return email_address.verified
-        except EmailAddress.DoesNotExist:
-            return False
+        if self.verified:
+            return True
+        return EmailAddress.objects.filter(user=self, primary=True, verified=True).exists()
 
-    @property
+    @cached_property
     def user_token(self):
         """
         Get the authentication token for the user.
@@ -104,6 +137,12 @@ class User(AbstractUser):
         verbose_name = "User Account"
         verbose_name_plural = "Users Account"
         ordering = ["-date_joined"]
+        indexes = [
+            # Serves the default ordering without a sort step
+            Index(fields=["-date_joined"], name="user_date_joined_idx"),
+            # A partial index stays small on a low-cardinality boolean and only covers the filtered value
+            Index(fields=["verified"], condition=Q(verified=True), name="user_verified_true"),
+        ]
 
 
 class UserFollow(TimeStampedModel):
@@ -122,6 +161,8 @@ class UserFollow(TimeStampedModel):
         verbose_name = "User Follow"
         verbose_name_plural = "Users Follow"
         ordering = ["-created"]
+        # follower and following are already indexed as foreign keys
+        indexes = [Index(fields=["-created"], name="userfollow_created_idx")]
 
 
 class Profile(TimeStampedModel):
@@ -168,6 +209,7 @@ class Profile(TimeStampedModel):
         verbose_name = _("User Profile")
         verbose_name_plural = _("Users Profile")
         ordering = ["-created"]
+        indexes = [Index(fields=["-created"], name="profile_created_idx")]
 
 
 class UserPrivacyConsent(TimeStampedModel):
@@ -200,6 +242,8 @@ class UserPrivacyConsent(TimeStampedModel):
     marketing_emails = BooleanField(default=False)
     third_party_services = BooleanField(default=False)
 
+    objects = UserPrivacyConsentQuerySet.as_manager()
+
     def __str__(self):
         """
         String representation of the UserPrivacyConsent instance.
@@ -213,6 +257,11 @@ class UserPrivacyConsent(TimeStampedModel):
         verbose_name = "User Privacy Consent"
         verbose_name_plural = "User Privacy Consents"
         ordering = ["-created"]
+        indexes = [
+            Index(fields=["-created"], name="privacyconsent_created_idx"),
+            # Underage users are the rare case worth filtering on
+            Index(fields=["of_legal_age"], condition=Q(of_legal_age=False), name="privacyconsent_underage_idx"),
+        ]
 
 
 class UserLocation(TimeStampedModel):
@@ -224,10 +273,10 @@ class UserLocation(TimeStampedModel):
     - town: Town of the user's location.
     - state: State of the user's location.
     - country: Country of the user's location.
-    - tracker: FieldTracker to keep track of changes in 'town', 'state', and 'country'.
+    - tracker: FieldTracker to keep track of changes in the location's fields.
 
     Properties:
-    - full_address: Combines town, state, and country to form a complete address.
+    - full_address: Combines town, state, and country to form a complete address (cached per instance).
 
     Methods:
     - __str__: Returns a string representation of the model instance.
@@ -242,7 +291,7 @@ class UserLocation(TimeStampedModel):
     town = CharField(max_length=50, blank=True)
     state = CharField(max_length=50, blank=True)
     country = CharField(max_length=50, blank=True)
-    tracker = FieldTracker(fields=["town", "state", "country"])
+    tracker = FieldTracker()
 
     def __str__(self):
         """
@@ -253,7 +302,23 @@ class UserLocation(TimeStampedModel):
         """
         return f"Locations for {self.user.username}"
 
-    @property
+    def save(self, *args, **kwargs):
+        """
+        Save the location, limiting the UPDATE of an existing row to the fields that changed.
+
+        Nothing is written when no field changed. Explicit `update_fields` are left untouched.
+        """
+        if not self._state.adding and "update_fields" not in kwargs:
+            changed = list(self.tracker.changed())
+            if not changed:
+                return
+            kwargs["update_fields"] = changed
+
+        # The address parts may have changed, drop the cached value
+        self.__dict__.pop("full_address", None)
+        super().save(*args, **kwargs)
+
+    @cached_property
     def full_address(self):
         """
         Combines town, state, and country to form a complete address.
@@ -261,10 +326,10 @@ class UserLocation(TimeStampedModel):
         Returns:
         - str: Combined address.
         """
-        address_components = filter(None, [self.town, self.state, self.country])
-        return ", ".join(address_components)
+        return ", ".join(part for part in (self.town, self.state, self.country) if part)
 
     class Meta:
         verbose_name = "User Location"
         verbose_name_plural = "User Locations"
         ordering = ["-created"]
+        indexes = [Index(fields=["-created"], name="userlocation_created_idx")]
@@ -1,22 +1,41 @@
-from datetime import date
-
 from allauth.account.adapter import get_adapter
+from allauth.account.models import EmailAddress
 from allauth.account.signals import user_logged_in  # , user_signed_up
 
 # from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.db.models.signals import post_save  # , pre_save
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from iwitness_be.monetize.models import UserBankAccount, UserEarning
-from iwitness_be.users.models import Profile, UserLocation, UserPrivacyConsent
-from iwitness_be.utils.email_sender import CustomEmailSender
+from iwitness_be.monetize.models import UserEarning
+from iwitness_be.users.models import Profile, UserFollow, UserLocation, UserPrivacyConsent
+from iwitness_be.users.tasks import send_new_ip_email
 from iwitness_be.utils.logger import LOGGER
 
-today = date.today()
 User = get_user_model()
 
 
+@receiver(pre_save, sender=User)
+def verify_new_superuser(sender, instance, **kwargs):
+    """
+    Signal handler to mark a superuser as verified before it is first inserted.
+
+    Setting the flag on the instance before the INSERT avoids a follow-up UPDATE once the user exists.
+
+    Args:
+    - sender: The sender of the signal.
+    - instance: The instance of the User model.
+    - kwargs: Additional keyword arguments.
+
+    Returns:
+    - None
+    """
+    if instance._state.adding and instance.is_superuser:
+        instance.verified = True
+
+
 @receiver(post_save, sender=User)
 def create_user_relationships(sender, instance, created, **kwargs):
     """
@@ -32,23 +51,24 @@ def create_user_relationships(sender, instance, created, **kwargs):
     - None
     """
     if created:
-        # If the user is a superuser, mark them as verified
-        if instance.is_superuser:
-            User.objects.filter(username=instance.username).update(verified=True)
-
-        # Create profile, privacy consent, location, bank account, and earning objects for the user
-        Profile.objects.create(user=instance)
-        UserPrivacyConsent.objects.create(user=instance)
-        UserLocation.objects.create(user=instance)
-        UserBankAccount.objects.create(user=instance)
-        UserEarning.objects.create(user=instance)
+        # Create profile, privacy consent, location and earning objects for the user in a single
+        # transaction so the child inserts are committed together. The bank account is left out, its
+        # bank is required and only known once the user picks one. No savepoint is taken, which saves
+        # the SAVEPOINT/RELEASE round-trips inside an outer transaction. Only there (e.g.
+        # ATOMIC_REQUESTS) do the user and its children fail as a whole; from createsuperuser, the
+        # shell or Celery the user INSERT has already autocommitted before this block runs.
+        with transaction.atomic(savepoint=False):
+            Profile.objects.create(user=instance)
+            UserPrivacyConsent.objects.create(user=instance)
+            UserLocation.objects.create(user=instance)
+            UserEarning.objects.create(user=instance)
 
         # Log information about the relationships creation
+        # Arguments are only formatted by loguru when the INFO level is enabled
         LOGGER.info(
-            f"""
-            [RELATIONSHIP CREATED] The {instance.username} account has been
-            created successfully with all relationships attached to the main
-            user account"""
+            "[RELATIONSHIP CREATED] The {} account has been created successfully "
+            "with all relationships attached to the main user account",
+            instance.username,
         )
 
 
@@ -68,13 +88,108 @@ def update_user_ip_on_login(sender, request, user, **kwargs):
     """
     adapter = get_adapter(request)
     user_ip = adapter.get_client_ip(request)
+    prev_ip = user._orig_user_ip
+
+    # Nothing to store or report when the user logs in from the same address
+    if prev_ip == user_ip:
+        return
+
     user.user_ip = user_ip
     user.save(update_fields=["user_ip"])
-    ctx = {"old_ip": user.tracker.previous(user_ip), "new_ip": user_ip, "username": user.username}
-    email = user.email
-    if (
-        user.tracker.has_changed("user_ip")
-        and user.tracker.previous("user_ip") != user_ip
-        and user.tracker.previous("user_ip") is not None
-    ):
-        CustomEmailSender.send_mail(template_prefix="emails/new_ip_emails/new_ip_address", email=email, context=ctx)
+    user._orig_user_ip = user_ip
+
+    # Only notify when the user had a known address before this login. The email is sent by a
+    # worker once the IP update is committed, keeping SMTP latency out of the login response.
+    if prev_ip is not None:
+        ctx = {"old_ip": prev_ip, "new_ip": user_ip, "username": user.username}
+        email = user.email
+        transaction.on_commit(lambda: send_new_ip_email.delay(email, ctx))
+
+
+@receiver(post_save, sender=EmailAddress)
+def sync_user_verified(sender, instance, **kwargs):
+    """
+    Signal handler to mirror the verification state of the user's primary email address on `User.verified`.
+
+    Every allauth path that confirms an address, creates an already verified one (social signups,
+    invites) or switches the primary address saves the EmailAddress, so this covers them all.
+    Superusers keep the `verified` flag they are created with.
+
+    Args:
+    - sender: The sender of the signal.
+    - instance: The saved EmailAddress instance.
+    - kwargs: Additional keyword arguments.
+
+    Returns:
+    - None
+    """
+    verified = EmailAddress.objects.filter(user_id=instance.user_id, primary=True, verified=True).exists()
+    User.objects.filter(pk=instance.user_id, is_superuser=False).update(verified=verified)
+
+
+@receiver(post_save, sender=UserFollow)
+def increment_follow_counts(sender, instance, created, **kwargs):
+    """
+    Signal handler to bump the denormalized follow counters when a follow is created.
+
+    Args:
+    - sender: The sender of the signal.
+    - instance: The instance of the UserFollow model.
+    - created: A boolean indicating if the instance was created.
+    - kwargs: Additional keyword arguments.
+
+    Returns:
+    - None
+    """
+    if created:
+        User.objects.filter(pk=instance.following_id).update(followers_count=F("followers_count") + 1)
+        User.objects.filter(pk=instance.follower_id).update(following_count=F("following_count") + 1)
+
+
+@receiver(post_delete, sender=UserFollow)
+def decrement_follow_counts(sender, instance, **kwargs):
+    """
+    Signal handler to lower the denormalized follow counters when a follow is removed.
+
+    Args:
+    - sender: The sender of the signal.
+    - instance: The instance of the UserFollow model.
+    - kwargs: Additional keyword arguments.
+
+    Returns:
+    - None
+    """
+    User.objects.filter(pk=instance.following_id).update(followers_count=F("followers_count") - 1)
+    User.objects.filter(pk=instance.follower_id).update(following_count=F("following_count") - 1)
+
+
+@receiver(m2m_changed, sender=UserFollow)
+def increment_follow_counts_on_add(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Signal handler to bump the follow counters for follows added through `followers.add()`/`following.add()`.
+
+    Those bulk-create the UserFollow rows without sending `post_save`. Removals go through a queryset
+    delete, which does send `post_delete`, so only additions are handled here.
+
+    Args:
+    - sender: The sender of the signal.
+    - instance: The User whose relation was changed.
+    - action: The m2m_changed action.
+    - reverse: False when called from `followers`, True when called from `following`.
+    - pk_set: Primary keys of the users that were actually added.
+    - kwargs: Additional keyword arguments.
+
+    Returns:
+    - None
+    """
+    if action != "post_add" or not pk_set:
+        return
+
+    if reverse:
+        # `instance` started following the users in `pk_set`
+        User.objects.filter(pk=instance.pk).update(following_count=F("following_count") + len(pk_set))
+        User.objects.filter(pk__in=pk_set).update(followers_count=F("followers_count") + 1)
+    else:
+        # The users in `pk_set` started following `instance`
+        User.objects.filter(pk=instance.pk).update(followers_count=F("followers_count") + len(pk_set))
+        User.objects.filter(pk__in=pk_set).update(following_count=F("following_count") + 1)
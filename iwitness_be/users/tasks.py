@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 
 from config import celery_app
+from iwitness_be.utils.email_sender import CustomEmailSender
 
 User = get_user_model()
 
@@ -9,3 +10,9 @@ User = get_user_model()
 def get_users_count():
     """A pointless Celery task to demonstrate usage."""
     return User.objects.count()
+
+
+@celery_app.task()
+def send_new_ip_email(email, ctx):
+    """Notify a user that their account was accessed from a new IP address."""
+    CustomEmailSender().send_mail(template_prefix="emails/new_ip_emails/new_ip_address", email=email, context=ctx)
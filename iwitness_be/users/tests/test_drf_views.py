@@ -31,4 +31,6 @@ class TestUserViewSet:
         assert response.data == {
             "url": f"http://testserver/api/users/{user.pk}/",
             "name": user.name,
+            "followers_count": 0,
+            "following_count": 0,
         }
@@ -0,0 +1,120 @@
+import pytest
+from allauth.account.models import EmailAddress
+
+from iwitness_be.monetize.models import UserBankAccount, UserEarning
+from iwitness_be.users.models import Profile, User, UserFollow, UserLocation, UserPrivacyConsent
+from iwitness_be.users.tests.factories import UserFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_new_user_gets_its_child_rows():
+    user = UserFactory(email="new@example.com", username="new")
+
+    assert Profile.objects.filter(user=user).exists()
+    assert UserPrivacyConsent.objects.filter(user=user).exists()
+    assert UserLocation.objects.filter(user=user).exists()
+    assert UserEarning.objects.filter(user=user, balance=0).exists()
+    # The bank account is only created once the user picks a bank
+    assert not UserBankAccount.objects.filter(user=user).exists()
+
+
+class TestUserVerified:
+    @pytest.fixture
+    def member(self) -> User:
+        return UserFactory(email="member@example.com", username="member")
+
+    def verified(self, user):
+        user.refresh_from_db()
+        return user.verified
+
+    def test_confirming_primary_email_verifies_user(self, member: User):
+        primary = EmailAddress.objects.create(user=member, email=member.email, primary=True)
+        assert not self.verified(member)
+
+        primary.set_verified()
+        assert self.verified(member)
+
+    def test_creating_a_verified_primary_email_verifies_user(self, member: User):
+        # What allauth's setup_user_email does for social signups and invites
+        EmailAddress.objects.create(user=member, email=member.email, primary=True, verified=True)
+        assert self.verified(member)
+
+    def test_confirming_secondary_email_keeps_unverified_primary(self, member: User):
+        EmailAddress.objects.create(user=member, email=member.email, primary=True)
+        secondary = EmailAddress.objects.create(user=member, email="other@example.com")
+        secondary.set_verified()
+
+        assert not self.verified(member)
+
+    def test_switching_to_unverified_primary_clears_verified(self, member: User):
+        EmailAddress.objects.create(user=member, email=member.email, primary=True, verified=True)
+        new = EmailAddress.objects.create(user=member, email="new@example.com")
+        new.set_as_primary()
+
+        assert not self.verified(member)
+        assert not member.is_email_verified
+
+    def test_bulk_verified_address_is_found_by_fallback(self, member: User):
+        EmailAddress.objects.create(user=member, email=member.email, primary=True)
+        # The allauth admin's "mark verified" action updates without saving
+        EmailAddress.objects.filter(user=member).update(verified=True)
+
+        assert not self.verified(member)
+        assert member.is_email_verified
+
+    def test_superuser_is_verified_on_creation(self):
+        superuser = User.objects.create_superuser(email="root@example.com", password="x", username="root")
+        EmailAddress.objects.create(user=superuser, email=superuser.email, primary=True)
+
+        assert self.verified(superuser)
+
+
+class TestFollowCounts:
+    @pytest.fixture
+    def users(self) -> list[User]:
+        return [UserFactory(email=f"{name}@example.com", username=name) for name in ("ada", "bola", "chidi")]
+
+    def counts(self, users):
+        return [
+            (user.followers_count, user.following_count)
+            for user in User.objects.filter(pk__in=[user.pk for user in users]).order_by("username")
+        ]
+
+    def test_followers_add(self, users):
+        ada, bola, chidi = users
+        ada.followers.add(bola, chidi)
+        assert self.counts(users) == [(2, 0), (0, 1), (0, 1)]
+
+    def test_following_add(self, users):
+        ada, bola, chidi = users
+        ada.following.add(bola, chidi)
+        assert self.counts(users) == [(0, 2), (1, 0), (1, 0)]
+
+    def test_re_adding_an_existing_follow_is_not_counted(self, users):
+        ada, bola, _ = users
+        ada.followers.add(bola)
+        ada.followers.add(bola)
+        assert self.counts(users) == [(1, 0), (0, 1), (0, 0)]
+
+    def test_remove(self, users):
+        ada, bola, chidi = users
+        ada.followers.add(bola, chidi)
+        ada.followers.remove(bola)
+        assert self.counts(users) == [(1, 0), (0, 0), (0, 1)]
+
+    def test_clear(self, users):
+        ada, bola, chidi = users
+        ada.followers.add(bola, chidi)
+        chidi.followers.add(ada)
+        ada.followers.clear()
+        assert self.counts(users) == [(0, 1), (0, 0), (1, 0)]
+
+    def test_create_and_delete(self, users):
+        ada, bola, _ = users
+        follow = UserFollow.objects.create(following=ada, follower=bola)
+        assert self.counts(users) == [(1, 0), (0, 1), (0, 0)]
+        assert list(ada.followers.all()) == [bola]
+
+        follow.delete()
+        assert self.counts(users) == [(0, 0), (0, 0), (0, 0)]
@@ -1,7 +1,7 @@
 import pytest
 from celery.result import EagerResult
 
-from iwitness_be.users.tasks import get_users_count
+from iwitness_be.users.tasks import get_users_count, send_new_ip_email
 from iwitness_be.users.tests.factories import UserFactory
 
 pytestmark = pytest.mark.django_db
@@ -14,3 +14,13 @@ def test_user_count(settings):
     task_result = get_users_count.delay()
     assert isinstance(task_result, EagerResult)
     assert task_result.result == 3
+
+
+def test_send_new_ip_email(settings, mailoutbox):
+    """The new IP notification is rendered and sent to the user."""
+    settings.CELERY_TASK_ALWAYS_EAGER = True
+    ctx = {"old_ip": "10.0.0.1", "new_ip": "10.0.0.2", "username": "witness"}
+    task_result = send_new_ip_email.delay("witness@example.com", ctx)
+    assert isinstance(task_result, EagerResult)
+    assert len(mailoutbox) == 1
+    assert mailoutbox[0].to == ["witness@example.com"]
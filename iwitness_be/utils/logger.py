@@ -3,6 +3,26 @@ from sys import stdout
 
 from loguru import logger as custom_logger
 
+TIME_FORMAT = "{time:MM-DD-YYYY HH:mm:ss}"
+LEVEL_FORMAT = "<fg #6ABCFF>{level}</fg #6ABCFF>:"
+MESSAGE_FORMAT = "<light-white>{message}</light-white>\n"
+
+LEVEL_STYLES = {
+    "TRACE": "<fg #DFF0FF>",
+    "INFO": "<fg #A2D2FC>",
+    "DEBUG": "<fg #889CF8>",
+    "WARNING": "<fg #F0B34A>",
+    "SUCCESS": "<fg #17F591>",
+    "ERROR": "<fg #FA0000>",
+}
+DEFAULT_LEVEL_STYLE = "<fg #C2E3FF>"
+
+# Full format string per level, built once so formatting a record is a single lookup
+_LEVEL_LOG_FORMATS = {
+    level: f"{TIME_FORMAT} | {style}{LEVEL_FORMAT}</> {MESSAGE_FORMAT}" for level, style in LEVEL_STYLES.items()
+}
+_DEFAULT_LOG_FORMAT = f"{TIME_FORMAT} | {DEFAULT_LEVEL_STYLE}{LEVEL_FORMAT}</> {MESSAGE_FORMAT}"
+
 
 def log_formatter(record: dict) -> str:
     """
@@ -14,29 +34,16 @@ def log_formatter(record: dict) -> str:
     Returns:
     - str: Formatted log message.
     """
-    time_format = "{time:MM-DD-YYYY HH:mm:ss}"
-    level_format = "<fg #6ABCFF>{level}</fg #6ABCFF>:"
-    message_format = "<light-white>{message}</light-white>\n"
-
-    level_styles = {
-        "TRACE": "<fg #DFF0FF>",
-        "INFO": "<fg #A2D2FC>",
-        "DEBUG": "<fg #889CF8>",
-        "WARNING": "<fg #F0B34A>",
-        "SUCCESS": "<fg #17F591>",
-        "ERROR": "<fg #FA0000>",
-    }
-
-    log_level = record["level"].name
-    level_style = level_styles.get(log_level, "<fg #C2E3FF>")
-
-    return f"{time_format} | {level_style}{level_format} {message_format}"
+    return _LEVEL_LOG_FORMATS.get(record["level"].name, _DEFAULT_LOG_FORMAT)
 
 
 def create_logger() -> custom_logger:
-    """Create custom logger."""
+    """Create custom logger.
+
+    Records are enqueued and written to stdout by loguru's worker thread, keeping the write off the request thread.
+    """
     custom_logger.remove()
-    custom_logger.add(stdout, colorize=True, format=log_formatter)
+    custom_logger.add(stdout, colorize=True, format=log_formatter, enqueue=True)
     return custom_logger
 
 
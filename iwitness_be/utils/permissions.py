@@ -7,18 +7,15 @@ class IsOwnerOrStaff(permissions.BasePermission):
     """
 
     def has_permission(self, request, view):
-        # Check if the user is authenticated
-        if request.user.is_authenticated:
-            # Allow access if the user is a staff member
-            return request.user.is_staff
-        return False
+        # Any authenticated user may reach the view, ownership is decided per object
+        user = request.user
+        return bool(user and user.is_authenticated)
 
     def has_object_permission(self, request, view, obj):
+        user = request.user
         # Check if the user is authenticated
-        if request.user.is_authenticated:
-            # Allow access if the user is a staff member
-            if request.user.is_staff:
-                return True
-            # Allow access if the user is the owner of the object
-            return obj.user == request.user
-        return False
+        if not user.is_authenticated:
+            return False
+        # Allow access if the user is a staff member or the owner of the object,
+        # comparing ids so the owner is not fetched from the database
+        return user.is_staff or obj.user_id == user.id
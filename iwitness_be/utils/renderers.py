@@ -0,0 +1,20 @@
+import orjson
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(renderers.BaseRenderer):
+    """
+    JSON renderer backed by orjson for endpoints returning large lists of plain values.
+
+    Types orjson does not handle natively (lazy translations, Decimals, ...) fall back to DRF's encoder.
+    """
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return orjson.dumps(data, default=JSONEncoder().default)
@@ -0,0 +1,38 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from rest_framework.test import APIRequestFactory
+
+from iwitness_be.monetize.models import UserEarning
+from iwitness_be.users.models import User
+from iwitness_be.utils.permissions import IsOwnerOrStaff
+
+OWNER = User(id=1, email="owner@example.com")
+OTHER = User(id=2, email="other@example.com")
+STAFF = User(id=3, email="staff@example.com", is_staff=True)
+
+
+@pytest.fixture
+def request_for():
+    def build(user):
+        request = APIRequestFactory().get("/fake-url/")
+        request.user = user
+        return request
+
+    return build
+
+
+@pytest.mark.parametrize(
+    "user, allowed",
+    [(AnonymousUser(), False), (OWNER, True), (OTHER, True), (STAFF, True)],
+)
+def test_has_permission(request_for, user, allowed):
+    assert IsOwnerOrStaff().has_permission(request_for(user), view=None) is allowed
+
+
+@pytest.mark.parametrize(
+    "user, allowed",
+    [(AnonymousUser(), False), (OWNER, True), (OTHER, False), (STAFF, True)],
+)
+def test_has_object_permission(request_for, user, allowed):
+    obj = UserEarning(user_id=OWNER.id)
+    assert IsOwnerOrStaff().has_object_permission(request_for(user), view=None, obj=obj) is allowed
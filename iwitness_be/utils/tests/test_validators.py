@@ -0,0 +1,51 @@
+import pytest
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from iwitness_be.utils.validators import validate_uploaded_image_extension, validate_uploaded_pdf_extension
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR" + b"\x00" * 32
+JPEG = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + b"\x00" * 32
+PDF = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+SVG = b'<?xml version="1.0" encoding="UTF-8"?>\n<svg xmlns="http://www.w3.org/2000/svg" width="1" height="1"></svg>'
+HTML_WITH_SVG = (
+    b"<!DOCTYPE html>\n<html><head><title>x</title></head><body>"
+    b'<svg xmlns="http://www.w3.org/2000/svg"></svg><script>alert(1)</script></body></html>'
+)
+
+
+@pytest.mark.parametrize(
+    "name, content",
+    [
+        ("photo.png", PNG),
+        ("photo.jpg", JPEG),
+        ("logo.svg", SVG),
+        ("logo.svg", b"\xef\xbb\xbf  " + SVG),
+        # A binary signature wins over an `<svg` string early in the file
+        ("photo.png", PNG + b"<svg"),
+    ],
+)
+def test_image_validator_accepts_valid_images(name, content):
+    upload = SimpleUploadedFile(name, content)
+    validate_uploaded_image_extension(upload)
+    assert upload.tell() == 0
+
+
+@pytest.mark.parametrize("name, content", [("report.pdf", PDF), ("scan.jpg", JPEG)])
+def test_pdf_validator_accepts_valid_documents(name, content):
+    validate_uploaded_pdf_extension(SimpleUploadedFile(name, content))
+
+
+def test_image_validator_rejects_html_with_embedded_svg():
+    with pytest.raises(ValidationError, match="Unsupported image file type."):
+        validate_uploaded_image_extension(SimpleUploadedFile("logo.svg", HTML_WITH_SVG))
+
+
+def test_image_validator_rejects_mismatched_content():
+    with pytest.raises(ValidationError, match="Unsupported image file type."):
+        validate_uploaded_image_extension(SimpleUploadedFile("photo.png", PDF))
+
+
+def test_image_validator_rejects_wrong_extension():
+    with pytest.raises(ValidationError, match="Unacceptable file extension."):
+        validate_uploaded_image_extension(SimpleUploadedFile("photo.gif", PNG))
@@ -3,33 +3,65 @@ import os
 import magic
 from django.core.exceptions import ValidationError
 
+# Reuse one detector so the magic database is loaded once per process, not on every upload
+_MIME_DETECTOR = magic.Magic(mime=True)
+
+# Header signatures for the types we accept; libmagic is only consulted for anything else
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"%PDF-", "application/pdf"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (b"\x1f\x8b", "application/gzip"),
+)
+
+_IMAGE_MIME_TYPES = frozenset({"image/svg+xml", "image/jpeg", "image/png"})
+_IMAGE_EXTENSIONS = frozenset({".svg", ".jpg", ".png"})
+_PDF_MIME_TYPES = frozenset({"image/jpeg", "application/pdf"})
+_PDF_EXTENSIONS = frozenset({".pdf", ".jpg", ".jpeg"})
+_ZIP_MIME_TYPES = frozenset({"application/x-7z-compressed", "application/gzip", "application/zip"})
+_ZIP_EXTENSIONS = frozenset({".zip", ".7z", ".gz"})
+
+
+def _sniff(chunk):
+    for signature, mime_type in _SIGNATURES:
+        if chunk.startswith(signature):
+            return mime_type
+
+    # Only a document whose root element is <svg> is labelled SVG here, markup that merely embeds
+    # an <svg> (e.g. an HTML page) is left to libmagic
+    head = chunk.removeprefix(b"\xef\xbb\xbf").lstrip().lower()
+    if head.startswith(b"<?xml"):
+        end = head.find(b"?>")
+        head = head[end + 2 :].lstrip() if end != -1 else b""
+    if head.startswith((b"<svg", b"<!doctype svg")):
+        return "image/svg+xml"
+    return None
+
 
 def validate_uploaded_file_extension(value, valid_mime_types, valid_file_extensions, error_message):
-    file_mime_type = magic.from_buffer(value.read(1024), mime=True)
+    # Check the extension first, it is free compared to sniffing the file content
+    ext = os.path.splitext(value.name)[1].lower()
+    if ext not in valid_file_extensions:
+        raise ValidationError(f"Unacceptable file extension. Expected one of {sorted(valid_file_extensions)}")
+
+    # Rewind around the read so the file can still be saved from the start
+    value.seek(0)
+    chunk = value.read(1024)
+    value.seek(0)
+    file_mime_type = _sniff(chunk) or _MIME_DETECTOR.from_buffer(chunk)
     if file_mime_type not in valid_mime_types:
         raise ValidationError(error_message)
 
-    ext = os.path.splitext(value.name)[1]
-    if ext.lower() not in valid_file_extensions:
-        raise ValidationError(f"Unacceptable file extension. Expected one of {valid_file_extensions}")
-
 
 def validate_uploaded_image_extension(value):
-    valid_mime_types = ["image/svg+xml", "image/jpeg", "image/png"]
-    valid_file_extensions = [".svg", ".jpg", ".png"]
-    error_message = "Unsupported image file type."
-    validate_uploaded_file_extension(value, valid_mime_types, valid_file_extensions, error_message)
+    validate_uploaded_file_extension(value, _IMAGE_MIME_TYPES, _IMAGE_EXTENSIONS, "Unsupported image file type.")
 
 
 def validate_uploaded_pdf_extension(value):
-    valid_mime_types = ["image/jpeg", "application/pdf"]
-    valid_file_extensions = [".pdf", ".jpg", ".jpeg"]
-    error_message = "Unsupported upload file type."
-    validate_uploaded_file_extension(value, valid_mime_types, valid_file_extensions, error_message)
+    validate_uploaded_file_extension(value, _PDF_MIME_TYPES, _PDF_EXTENSIONS, "Unsupported upload file type.")
 
 
 def validate_uploaded_zip_extension(value):
-    valid_mime_types = ["application/x-7z-compressed", "application/gzip", "application/zip"]
-    valid_file_extensions = [".zip", ".7z", ".gz"]
-    error_message = "Unsupported upload file type."
-    validate_uploaded_file_extension(value, valid_mime_types, valid_file_extensions, error_message)
+    validate_uploaded_file_extension(value, _ZIP_MIME_TYPES, _ZIP_EXTENSIONS, "Unsupported upload file type.")